@@ -1,9 +1,11 @@
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+from .cache import FragmentCache, render_row
+from .routing import READ_BIND, RoutingSession, remember_write
 from os import getenv, path
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 migrate = Migrate()
 
 def create_app():
@@ -15,13 +17,24 @@ def create_app():
     app.config.from_mapping(
         SECRET_KEY=getenv("SECRET_KEY", "dev"),
         SQLALCHEMY_DATABASE_URI=db_path,
-        SQLALCHEMY_TRACK_MODIFICATIONS=False
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+        # Seconds after a write during which a client's reads stay on the primary
+        READ_YOUR_WRITES_SECONDS=float(getenv("READ_YOUR_WRITES_SECONDS", "5"))
     )
 
+    # Optional read replica for list/report views; without it everything uses the primary
+    read_db_path = getenv("DATABASE_READ_URL")
+    if read_db_path:
+        app.config["SQLALCHEMY_BINDS"] = {READ_BIND: read_db_path}
+
     from .models import Patient, Sample, TestOrder  # noqa: F401
     db.init_app(app)
     migrate.init_app(app, db)
 
+    # LRU cache of rendered list rows; FRAGMENT_CACHE_SIZE=0 disables it
+    app.extensions["fragment_cache"] = FragmentCache(int(getenv("FRAGMENT_CACHE_SIZE", "5000")))
+    app.jinja_env.globals["render_row"] = render_row
+
     with app.app_context():
         # Create tables if they don't exist (for Railway deployment)
         try:
@@ -32,6 +45,8 @@ def create_app():
         from .routes import bp
         app.register_blueprint(bp)
 
+    app.after_request(remember_write)
+
     @app.context_processor
     def inject_globals():
         return {"APP_NAME": "Specimen Tracker"}
@@ -0,0 +1,66 @@
+from collections import OrderedDict
+from threading import Lock
+from flask import current_app, request
+from markupsafe import Markup
+
+
+class FragmentCache:
+    """Bounded LRU cache for rendered template fragments (e.g. table rows)."""
+
+    def __init__(self, maxsize=5000):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+def render_row(template_name, obj, **context):
+    """Render a single row partial, reusing the cached HTML while the row's
+    version stamp (``obj.row_version``) is unchanged."""
+    cache = current_app.extensions["fragment_cache"]
+    key = (template_name, request.script_root, obj.id, obj.row_version)
+    html = cache.get(key)
+    if html is None:
+        html = Markup(current_app.jinja_env.get_template(template_name).render(**context))
+        cache.set(key, html)
+    return html
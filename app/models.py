@@ -25,6 +25,11 @@ class Sample(db.Model):
     patient = db.relationship("Patient", back_populates="samples")
     test_orders = db.relationship("TestOrder", back_populates="sample", cascade="all, delete-orphan")
 
+    @property
+    def row_version(self):
+        """Stamp of every value shown in a samples_list row; changes when the row does."""
+        return (self.sample_type, self.collection_datetime, self.status, self.patient.full_name)
+
     def __repr__(self):
         return f"<Sample {self.sample_type} for patient_id={self.patient_id}>"
 
@@ -39,5 +44,15 @@ class TestOrder(db.Model):
 
     sample = db.relationship("Sample", back_populates="test_orders")
 
+    @property
+    def row_version(self):
+        """Stamp of every value shown in a tests_list row; changes when the row does."""
+        sample = self.sample
+        return (
+            self.sample_id, self.assay, self.priority, bool(self.result), self.result_date,
+            sample.sample_type, sample.collection_datetime,
+            sample.patient_id, sample.patient.full_name, sample.patient.nhs_number,
+        )
+
     def __repr__(self):
         return f"<TestOrder {self.assay} on sample_id={self.sample_id}>"
@@ -2,11 +2,13 @@ from datetime import datetime, timezone
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 from . import db
 from .models import Patient, Sample, TestOrder
+from .routing import read_replica
 
 bp = Blueprint("main", __name__)
 
 # Home
 @bp.route("/")
+@read_replica
 def index():
     total_patients = Patient.query.count()
     total_samples = Sample.query.count()
@@ -35,6 +37,7 @@ def index():
 
 # ---------- Patients CRUD ----------
 @bp.route("/patients")
+@read_replica
 def patients_list():
     q = request.args.get("q", "").strip()
     if q:
@@ -104,6 +107,7 @@ def patients_delete(patient_id):
 
 # ---------- Samples CRUD ----------
 @bp.route("/samples")
+@read_replica
 def samples_list():
     q = request.args.get("q", "").strip()
     status_filter = request.args.get("status", "").strip()
@@ -196,6 +200,7 @@ def samples_delete(sample_id):
 
 # ---------- Tests CRUD ----------
 @bp.route("/tests")
+@read_replica
 def tests_list():
     q = request.args.get("q", "").strip()
     status_filter = request.args.get("status", "").strip()
@@ -0,0 +1,36 @@
+from functools import wraps
+from time import time
+from flask import current_app, g, has_app_context, request, session
+from flask_sqlalchemy.session import Session
+
+READ_BIND = "read"
+
+
+class RoutingSession(Session):
+    """Session that sends queries from read-only views to the ``read`` bind
+    (DATABASE_READ_URL) when one is configured, and everything else to the primary."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and has_app_context() and g.get("use_read_replica"):
+            engine = self._db.engines.get(READ_BIND)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def read_replica(view):
+    """Route a read-only view's queries to the read replica, unless this client
+    wrote recently and must see its own changes (read-your-writes)."""
+    @wraps(view)
+    def wrapped(*args, **kwargs):
+        last_write = session.get("last_write", 0)
+        g.use_read_replica = time() - last_write > current_app.config["READ_YOUR_WRITES_SECONDS"]
+        return view(*args, **kwargs)
+    return wrapped
+
+
+def remember_write(response):
+    """after_request hook: stamp the client's session after any successful write."""
+    if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+        session["last_write"] = time()
+    return response
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Row Rendering Benchmark for Specimen Tracker
+Measures per-row render cost of the samples and tests list pages,
+uncached (before) versus with the row fragment cache warm (after)
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+REPEATS = 5
+
+def seed(db, Patient, Sample, TestOrder):
+    """Insert ROWS samples, each with one test order"""
+    patients = [
+        Patient(nhs_number=f"{i:010d}", full_name=f"Patient {i}", date_of_birth=date(1980, 1, 1))
+        for i in range(ROWS // 10 or 1)
+    ]
+    db.session.add_all(patients)
+    db.session.flush()
+    for i in range(ROWS):
+        s = Sample(patient_id=patients[i % len(patients)].id, sample_type="Blood",
+                   collection_datetime=datetime(2024, 1, 1, 9, 30), status="received")
+        s.test_orders.append(TestOrder(assay="FBC", priority="routine"))
+        db.session.add(s)
+    db.session.commit()
+
+def time_page(client, url):
+    """Best-of-REPEATS wall time for a GET, in seconds"""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        client.get(url)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    tmp = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tmp, "bench.db")
+
+    results = {}
+    for label, size in (("uncached", "0"), ("cached", str(ROWS * 2))):
+        os.environ["FRAGMENT_CACHE_SIZE"] = size
+        from app import create_app, db
+        from app.models import Patient, Sample, TestOrder
+        app = create_app()
+        with app.app_context():
+            if not Sample.query.count():
+                seed(db, Patient, Sample, TestOrder)
+        client = app.test_client()
+        for url in ("/samples", "/tests"):
+            client.get(url)  # warm-up (fills the cache when enabled)
+            results[(label, url)] = time_page(client, url)
+        print(f"{label}: {app.extensions['fragment_cache'].stats()}")
+
+    print(f"\n📊 Per-row render cost over {ROWS} rows")
+    for url in ("/samples", "/tests"):
+        before = results[("uncached", url)] / ROWS * 1e6
+        after = results[("cached", url)] / ROWS * 1e6
+        print(f"  {url:<9} before: {before:7.1f} µs/row  after: {after:7.1f} µs/row  ({before / after:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 import os
 import pytest
+from datetime import date
 from app import create_app, db
-from app.models import Patient
+from app.models import Patient, Sample
 
 @pytest.fixture()
 def client(tmp_path):
@@ -30,3 +31,56 @@ def test_create_patient(client):
     # Read (list)
     rv = client.get('/patients?q=Jane')
     assert b'Jane Doe' in rv.data
+
+def test_samples_list_row_cache(client):
+    app = client.application
+    with app.app_context():
+        p = Patient(nhs_number='9876543210', full_name='John Roe', date_of_birth=date(1980, 5, 5))
+        db.session.add(p)
+        db.session.flush()
+        s = Sample(patient_id=p.id, sample_type='Blood', status='received')
+        db.session.add(s)
+        db.session.commit()
+        sample_id = s.id
+    cache = app.extensions['fragment_cache']
+    cache.clear()
+    # First render misses, second is served from the cache
+    client.get('/samples')
+    rv = client.get('/samples')
+    assert b'received' in rv.data
+    assert cache.stats()['hits'] == 1
+    # Updating the row changes its version stamp, so it is re-rendered
+    with app.app_context():
+        db.session.get(Sample, sample_id).status = 'processing'
+        db.session.commit()
+    rv = client.get('/samples')
+    assert b'processing' in rv.data
+    assert cache.stats()['misses'] == 2
+
+def test_read_replica_routing(tmp_path, monkeypatch):
+    primary = 'sqlite:///' + str(tmp_path / 'primary.db')
+    replica = 'sqlite:///' + str(tmp_path / 'replica.db')
+    monkeypatch.setenv('SECRET_KEY', 'test')
+    # Build the replica schema and seed each database with a distinct patient
+    for url, name in ((replica, 'Replica Only'), (primary, 'Primary Only')):
+        monkeypatch.setenv('DATABASE_URL', url)
+        app = create_app()
+        with app.app_context():
+            db.session.add(Patient(nhs_number='1111111111', full_name=name, date_of_birth=date(1970, 1, 1)))
+            db.session.commit()
+    monkeypatch.setenv('DATABASE_READ_URL', replica)
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        # Read-only views are served from the replica
+        rv = client.get('/patients')
+        assert b'Replica Only' in rv.data
+        assert b'Primary Only' not in rv.data
+        # Writes go to the primary, and the writer then reads its own writes
+        rv = client.post('/patients/new', data={
+            'nhs_number': '2222222222',
+            'full_name': 'Jane Doe',
+            'date_of_birth': '1990-01-01'
+        }, follow_redirects=True)
+        assert b'Jane Doe' in rv.data
+        assert b'Primary Only' in rv.data